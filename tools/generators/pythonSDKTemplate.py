@@ -3,21 +3,400 @@ MASKSERVICE C20 1001 Configuration SDK - Python Implementation
 Universal configuration management with validation and real-time sync
 """
 
+import copy
 import json
+import logging
+import re
+import struct
 import time
 import threading
 import asyncio
 import aiohttp
+from multiprocessing import resource_tracker, shared_memory
 from typing import Dict, Any, Optional, Callable, Union
 from urllib.parse import urljoin
 import requests
 from jsonschema import validate, ValidationError
 
 
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_IDENTITY_KEYS = ("id", "key", "code")
+
+# Shared memory segments created by this process
+_owned_segments = set()
+
+
+def _deep_merge(base: dict, updates: dict) -> dict:
+    """Merge nested updates into a copy of base"""
+    merged = dict(base)
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class CrudRules:
+    """Compiled CRUD rules for local write checks"""
+
+    def __init__(self, crud: dict):
+        rules = crud.get("rules", {})
+        self.name = crud.get("name")
+        self.editable = self._compile_paths(rules.get("editable", []))
+        self.readonly = self._compile_paths(rules.get("readonly", []))
+        self.protected = self._compile_paths(rules.get("protected", []))
+        self.addable = self._compile_flag(rules.get("addable", False))
+        self.deletable = self._compile_flag(rules.get("deletable", False))
+        self.validation_rules: Dict[str, dict] = {
+            field: self._compile_field_rule(rule)
+            for field, rule in crud.get("validation_rules", {}).items()
+        }
+
+    @staticmethod
+    def _compile_paths(patterns: list) -> tuple:
+        """Split path patterns into an exact lookup set and one wildcard regex"""
+        exact = set()
+        wildcard = []
+        for pattern in patterns:
+            if "*" in pattern:
+                wildcard.append("/".join(
+                    "[^/]+" if part == "*" else re.escape(part)
+                    for part in pattern.split("/")
+                ))
+            else:
+                exact.add(pattern)
+        regex = re.compile(f"^(?:{'|'.join(wildcard)})$") if wildcard else None
+        return frozenset(exact), regex
+
+    @classmethod
+    def _compile_flag(cls, value: Union[bool, list]) -> Union[bool, tuple]:
+        """Compile addable/deletable, which are either a boolean or a path list"""
+        if isinstance(value, bool):
+            return value
+        return cls._compile_paths(value)
+
+    @staticmethod
+    def _compile_field_rule(rule: dict) -> dict:
+        compiled = dict(rule)
+        if "pattern" in rule:
+            compiled["pattern"] = re.compile(rule["pattern"])
+        if "enum" in rule:
+            compiled["enum"] = frozenset(rule["enum"])
+        return compiled
+
+    @staticmethod
+    def _matches(compiled: Union[bool, tuple], path: str) -> bool:
+        if isinstance(compiled, bool):
+            return compiled
+        exact, regex = compiled
+        return path in exact or (regex is not None and regex.match(path) is not None)
+
+    def _matches_subtree(self, compiled: tuple, path: str) -> bool:
+        """Match path or any of its ancestors"""
+        parts = path.split("/")
+        return any(
+            self._matches(compiled, "/".join(parts[:i]))
+            for i in range(len(parts), 0, -1)
+        )
+
+    def can_edit(self, path: str) -> bool:
+        if self._matches_subtree(self.readonly, path):
+            return False
+        return self._matches_subtree(self.editable, path)
+
+    def can_add(self, path: str) -> bool:
+        parent = path.rpartition("/")[0]
+        return self._matches(self.addable, parent)
+
+    def can_delete(self, path: str) -> bool:
+        if self._matches(self.protected, path):
+            return False
+        if "/" not in path and self._matches(self.protected, "*"):
+            return False
+        return self._matches(self.deletable, path)
+
+    @staticmethod
+    def _as_number(value: Any) -> Optional[float]:
+        """Numeric value of a number or numeric string, else None"""
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                return None
+        return None
+
+    def check_value(self, path: str, value: Any) -> list:
+        """Check a single leaf value against validation_rules.
+
+        field_types are UI widget hints and are not enforced; only an
+        explicit ``type`` in the field's validation rule is.
+        """
+        field = path.rpartition("/")[2]
+        errors = []
+        rule = self.validation_rules.get(field, {})
+        number = self._as_number(value)
+
+        if value is None or value == "":
+            if rule.get("required"):
+                errors.append(f"{path}: value is required")
+            return errors
+        if rule.get("type") == "number" and number is None:
+            errors.append(f"{path}: expected number")
+        if rule.get("type") == "integer" and not (number is not None and float(number).is_integer()):
+            errors.append(f"{path}: expected integer")
+
+        if number is not None:
+            if "min" in rule and number < rule["min"]:
+                errors.append(f"{path}: must be >= {rule['min']}")
+            if "max" in rule and number > rule["max"]:
+                errors.append(f"{path}: must be <= {rule['max']}")
+            if "multipleOf" in rule and round(number / rule["multipleOf"], 9) % 1:
+                errors.append(f"{path}: must be a multiple of {rule['multipleOf']}")
+        if isinstance(value, str):
+            if "minLength" in rule and len(value) < rule["minLength"]:
+                errors.append(f"{path}: length must be >= {rule['minLength']}")
+            if "maxLength" in rule and len(value) > rule["maxLength"]:
+                errors.append(f"{path}: length must be <= {rule['maxLength']}")
+        if "pattern" in rule and not rule["pattern"].search(str(value)):
+            errors.append(f"{path}: does not match {rule['pattern'].pattern}")
+        if "enum" in rule and value not in rule["enum"]:
+            errors.append(f"{path}: must be one of {sorted(rule['enum'])}")
+        if rule.get("format") == "email" and not _EMAIL_RE.match(str(value)):
+            errors.append(f"{path}: invalid email")
+        return errors
+
+    def _check_leaves(self, path: str, value: Any, errors: list):
+        """Check every leaf of a written value against validation_rules"""
+        if isinstance(value, dict):
+            for key, item in value.items():
+                self._check_leaves(f"{path}/{key}" if path else str(key), item, errors)
+        elif isinstance(value, list):
+            for index, item in enumerate(value):
+                self._check_leaves(f"{path}/{index}", item, errors)
+        else:
+            errors.extend(self.check_value(path, value))
+
+    @staticmethod
+    def _identity_key(old: list, new: list) -> Optional[str]:
+        """Field identifying list items, if every item has a unique one"""
+        items = old + new
+        if not items or not all(isinstance(item, dict) for item in items):
+            return None
+        for key in _IDENTITY_KEYS:
+            if not all(isinstance(item.get(key), (str, int)) for item in items):
+                continue
+            if all(len({item[key] for item in side}) == len(side) for side in (old, new)):
+                return key
+        return None
+
+    def _match_items(self, old: list, new: list) -> tuple:
+        """Pair list items as (old index, new index) matches, deletions, additions"""
+        key = self._identity_key(old, new)
+        if key is not None:
+            old_index = {item[key]: i for i, item in enumerate(old)}
+            new_index = {item[key]: i for i, item in enumerate(new)}
+            matched = [(old_index[ident], j) for ident, j in new_index.items() if ident in old_index]
+            deleted = [i for ident, i in old_index.items() if ident not in new_index]
+            added = [j for ident, j in new_index.items() if ident not in old_index]
+            return matched, deleted, added
+        if len(old) == len(new):
+            return [(i, i) for i in range(len(old))], [], []
+
+        # Without an identity a length change is whole-item adds/deletes
+        unmatched = list(range(len(old)))
+        added = []
+        for j, item in enumerate(new):
+            i = next((i for i in unmatched if old[i] == item), None)
+            if i is None:
+                added.append(j)
+            else:
+                unmatched.remove(i)
+        return [], unmatched, added
+
+    def _diff(self, path: str, old: Any, new: Any, errors: list):
+        if old is _MISSING:
+            if not self.can_add(path):
+                errors.append(f"{path}: adding is not allowed")
+            self._check_leaves(path, new, errors)
+            return
+        if new is _MISSING:
+            if not self.can_delete(path):
+                errors.append(f"{path}: deleting is not allowed")
+            return
+        if isinstance(old, dict) and isinstance(new, dict):
+            for key in old.keys() | new.keys():
+                child = f"{path}/{key}" if path else str(key)
+                self._diff(child, old.get(key, _MISSING), new.get(key, _MISSING), errors)
+            return
+        if isinstance(old, list) and isinstance(new, list):
+            matched, deleted, added = self._match_items(old, new)
+            for i, j in matched:
+                self._diff(f"{path}/{i}", old[i], new[j], errors)
+            for i in deleted:
+                self._diff(f"{path}/{i}", old[i], _MISSING, errors)
+            for j in added:
+                self._diff(f"{path}/{j}", _MISSING, new[j], errors)
+            return
+        if old == new:
+            return
+        if not self.can_edit(path):
+            errors.append(f"{path}: field is not editable")
+            return
+        self._check_leaves(path, new, errors)
+
+    def check(self, data: dict, current: dict) -> tuple[bool, list]:
+        """Check a write against the current config.
+
+        Only changed, added or removed paths are checked, so values the
+        server already holds are never rejected.
+        """
+        errors: list = []
+        self._diff("", current, data, errors)
+        return not errors, errors
+
+
+class SharedConfigCache:
+    """Cross-process config cache in a shared memory segment.
+
+    One owner process (``create=True``) fetches configs and publishes them;
+    other processes attach and read without locking. The header holds a
+    sequence counter (odd while a write is in progress) and the payload
+    length, followed by a JSON document of all published configs and the
+    counter value each was published at.
+
+    Only configs the owner keeps refreshing (e.g. with ``watch()``) stay
+    fresh; the owner republishes a config only when it fetches it again.
+    """
+
+    SEQ = struct.Struct("<Q")
+    LENGTH = struct.Struct("<Q")
+    HEADER_SIZE = SEQ.size + LENGTH.size
+    MAX_RETRIES = 100
+
+    def __init__(self, name: str = "maskservice_config", size: int = 1 << 20, create: bool = False):
+        self.name = name
+        self.owner = create
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.LENGTH.pack_into(self.shm.buf, self.SEQ.size, 0)
+            self.SEQ.pack_into(self.shm.buf, 0, 0)
+            _owned_segments.add(name)
+        else:
+            try:
+                self.shm = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:
+                # Python < 3.13: keep the tracker from unlinking the owner's segment on exit
+                self.shm = shared_memory.SharedMemory(name=name)
+                if name not in _owned_segments:
+                    resource_tracker.unregister(self.shm._name, "shared_memory")
+        self._lock = threading.Lock()
+        self._configs: Dict[str, Any] = {}
+        self._versions: Dict[str, int] = {}
+        self._version = -1
+
+    @property
+    def version(self) -> int:
+        """Current publish counter; changes on every publish"""
+        return self.SEQ.unpack_from(self.shm.buf, 0)[0]
+
+    def publish(self, config_name: str, data: dict):
+        """Publish a config to all attached processes (owner only)"""
+        if not self.owner:
+            raise RuntimeError("Only the owner process can publish to the shared cache")
+
+        with self._lock:
+            if self._configs.get(config_name) == data:
+                return
+
+            seq = self.SEQ.unpack_from(self.shm.buf, 0)[0]
+            configs = {**self._configs, config_name: copy.deepcopy(data)}
+            versions = {**self._versions, config_name: seq + 2}
+            payload = json.dumps({"configs": configs, "versions": versions}).encode("utf-8")
+            if self.HEADER_SIZE + len(payload) > self.shm.size:
+                raise ValueError(f"Shared cache {self.name} too small for {len(payload)} bytes")
+
+            # Length is only valid while the counter is even, so it is written
+            # between the odd and even counter stores, never alongside them
+            self.SEQ.pack_into(self.shm.buf, 0, seq + 1)
+            self.shm.buf[self.HEADER_SIZE:self.HEADER_SIZE + len(payload)] = payload
+            self.LENGTH.pack_into(self.shm.buf, self.SEQ.size, len(payload))
+            self.SEQ.pack_into(self.shm.buf, 0, seq + 2)
+            self._configs = configs
+            self._versions = versions
+            self._version = seq + 2
+
+    def _try_snapshot(self) -> bool:
+        """Refresh the parsed document; False while a write is in progress"""
+        seq = self.SEQ.unpack_from(self.shm.buf, 0)[0]
+        if seq == self._version:
+            return True
+        if seq % 2:
+            return False
+
+        length = self.LENGTH.unpack_from(self.shm.buf, self.SEQ.size)[0]
+        payload = bytes(self.shm.buf[self.HEADER_SIZE:self.HEADER_SIZE + length])
+        if self.SEQ.unpack_from(self.shm.buf, 0)[0] != seq:
+            return False
+
+        document = json.loads(payload) if payload else {}
+        self._configs = document.get("configs", {})
+        self._versions = document.get("versions", {})
+        self._version = seq
+        return True
+
+    def _lookup(self, config_name: str, newer_than: int) -> Optional[dict]:
+        if self._versions.get(config_name, 0) <= newer_than:
+            return None
+        return copy.deepcopy(self._configs[config_name])
+
+    def read(self, config_name: str, newer_than: int = 0) -> Optional[dict]:
+        """Read a copy of a published config.
+
+        Returns None if the config has not been published after counter
+        value ``newer_than``. Raises RuntimeError or ValueError when the
+        segment cannot be read.
+        """
+        for _ in range(self.MAX_RETRIES):
+            if self._try_snapshot():
+                return self._lookup(config_name, newer_than)
+            time.sleep(0.001)
+        raise RuntimeError(f"Shared cache {self.name} unreadable: write in progress")
+
+    async def read_async(self, config_name: str, newer_than: int = 0) -> Optional[dict]:
+        """Same as read() but yields to the event loop while a write is in progress"""
+        for _ in range(self.MAX_RETRIES):
+            if self._try_snapshot():
+                return self._lookup(config_name, newer_than)
+            await asyncio.sleep(0.001)
+        raise RuntimeError(f"Shared cache {self.name} unreadable: write in progress")
+
+    def close(self):
+        """Detach from the segment; the owner also removes it"""
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+            _owned_segments.discard(self.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class ConfigSDK:
     """Synchronous Configuration SDK"""
     
-    def __init__(self, base_url: str = "http://localhost:3000/api", headers: Dict = None, timeout: int = 30):
+    def __init__(self, base_url: str = "http://localhost:3000/api", headers: Dict = None, timeout: int = 30,
+                 shared_cache: Optional[SharedConfigCache] = None):
         self.base_url = base_url
         self.headers = {"Content-Type": "application/json"}
         if headers:
@@ -25,6 +404,9 @@ class ConfigSDK:
         self.timeout = timeout
         self.cache: Dict[str, Any] = {}
         self.schemas: Dict[str, dict] = {}
+        self.crud_rules: Dict[str, CrudRules] = {}
+        self.shared_cache = shared_cache
+        self._shared_writes: Dict[str, int] = {}
         self.watchers: Dict[str, threading.Thread] = {}
         self.session = requests.Session()
         self.session.headers.update(self.headers)
@@ -55,18 +437,27 @@ class ConfigSDK:
         except ValidationError as e:
             return False, [str(e)]
 
+    def check_crud(self, data: dict, config_name: str, current: dict) -> tuple[bool, list]:
+        """Check a write against compiled CRUD rules"""
+        rules = self.crud_rules.get(config_name)
+        if not rules:
+            raise ValueError(f"CRUD rules {config_name} not loaded")
+        return rules.check(data, current)
+
     def get(self, config_name: str, cache: bool = False, validate_data: bool = True) -> dict:
         """Get configuration"""
         if cache and config_name in self.cache:
             return self.cache[config_name]
 
         try:
-            response = self.session.get(
-                urljoin(self.base_url, f"config/{config_name}"),
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._read_shared(config_name)
+            if data is None:
+                response = self.session.get(
+                    urljoin(self.base_url, f"config/{config_name}"),
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                data = response.json()
 
             if validate_data and config_name in self.schemas:
                 valid, errors = self.validate(data, config_name)
@@ -76,6 +467,7 @@ class ConfigSDK:
             if cache:
                 self.cache[config_name] = data
 
+            self._publish(config_name, data)
             return data
         except Exception as e:
             raise Exception(f"Get config failed: {str(e)}")
@@ -87,6 +479,12 @@ class ConfigSDK:
             if not valid:
                 raise ValidationError(f"Validation failed: {', '.join(errors)}")
 
+        if validate_data and config_name in self.crud_rules:
+            current = self.get(config_name, cache=False, validate_data=False)
+            valid, errors = self.check_crud(data, config_name, current)
+            if not valid:
+                raise ValidationError(f"CRUD check failed: {', '.join(errors)}")
+
         try:
             response = self.session.put(
                 urljoin(self.base_url, f"config/{config_name}"),
@@ -99,6 +497,7 @@ class ConfigSDK:
             if config_name in self.cache:
                 self.cache[config_name] = updated
 
+            self._record_write(config_name, updated)
             return updated
         except Exception as e:
             raise Exception(f"Update config failed: {str(e)}")
@@ -114,6 +513,11 @@ class ConfigSDK:
                 if not valid:
                     raise ValidationError(f"Validation failed: {', '.join(errors)}")
 
+            if config_name in self.crud_rules:
+                valid, errors = self.check_crud(_deep_merge(current, updates), config_name, current)
+                if not valid:
+                    raise ValidationError(f"CRUD check failed: {', '.join(errors)}")
+
         try:
             response = self.session.patch(
                 urljoin(self.base_url, f"config/{config_name}"),
@@ -126,6 +530,7 @@ class ConfigSDK:
             if config_name in self.cache:
                 self.cache[config_name] = updated
 
+            self._record_write(config_name, updated)
             return updated
         except Exception as e:
             raise Exception(f"Patch config failed: {str(e)}")
@@ -142,6 +547,12 @@ class ConfigSDK:
         except Exception as e:
             raise Exception(f"Get CRUD failed: {str(e)}")
 
+    def load_crud(self, config_name: str) -> CrudRules:
+        """Load and compile CRUD rules for local write checks"""
+        rules = CrudRules(self.get_crud(config_name))
+        self.crud_rules[config_name] = rules
+        return rules
+
     def watch(self, config_name: str, callback: Callable, interval: float = 5.0) -> Callable:
         """Watch configuration for changes"""
         if config_name in self.watchers:
@@ -176,6 +587,37 @@ class ConfigSDK:
 
         return stop
 
+    def _read_shared(self, config_name: str) -> Optional[dict]:
+        """Read from the shared cache; None falls back to HTTP"""
+        if not self.shared_cache or self.shared_cache.owner:
+            return None
+        try:
+            data = self.shared_cache.read(config_name, newer_than=self._shared_writes.get(config_name, 0))
+        except (RuntimeError, ValueError) as e:
+            logger.warning(f"Shared cache read failed for {config_name}: {str(e)}")
+            return None
+        if data is not None:
+            self._shared_writes.pop(config_name, None)
+        return data
+
+    def _publish(self, config_name: str, data: dict):
+        """Publish to the shared cache; failures never fail the request"""
+        if not self.shared_cache or not self.shared_cache.owner:
+            return
+        try:
+            self.shared_cache.publish(config_name, data)
+        except Exception as e:
+            logger.warning(f"Shared cache publish failed for {config_name}: {str(e)}")
+
+    def _record_write(self, config_name: str, data: dict):
+        """Owners publish the write; workers read it over HTTP until the owner republishes"""
+        if not self.shared_cache:
+            return
+        if self.shared_cache.owner:
+            self._publish(config_name, data)
+        else:
+            self._shared_writes[config_name] = self.shared_cache.version
+
     def clear_cache(self, config_name: Optional[str] = None):
         """Clear cache"""
         if config_name:
@@ -201,7 +643,8 @@ class ConfigSDK:
 class AsyncConfigSDK:
     """Asynchronous Configuration SDK"""
     
-    def __init__(self, base_url: str = "http://localhost:3000/api", headers: Dict = None, timeout: int = 30):
+    def __init__(self, base_url: str = "http://localhost:3000/api", headers: Dict = None, timeout: int = 30,
+                 shared_cache: Optional[SharedConfigCache] = None):
         self.base_url = base_url
         self.headers = {"Content-Type": "application/json"}
         if headers:
@@ -209,6 +652,9 @@ class AsyncConfigSDK:
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.cache: Dict[str, Any] = {}
         self.schemas: Dict[str, dict] = {}
+        self.crud_rules: Dict[str, CrudRules] = {}
+        self.shared_cache = shared_cache
+        self._shared_writes: Dict[str, int] = {}
         self.watchers: Dict[str, asyncio.Task] = {}
         self.session: Optional[aiohttp.ClientSession] = None
 
@@ -249,6 +695,13 @@ class AsyncConfigSDK:
         except ValidationError as e:
             return False, [str(e)]
 
+    def check_crud(self, data: dict, config_name: str, current: dict) -> tuple[bool, list]:
+        """Check a write against compiled CRUD rules"""
+        rules = self.crud_rules.get(config_name)
+        if not rules:
+            raise ValueError(f"CRUD rules {config_name} not loaded")
+        return rules.check(data, current)
+
     async def get(self, config_name: str, cache: bool = False, validate_data: bool = True) -> dict:
         """Get configuration"""
         if not self.session:
@@ -258,20 +711,23 @@ class AsyncConfigSDK:
             return self.cache[config_name]
 
         try:
-            url = urljoin(self.base_url, f"config/{config_name}")
-            async with self.session.get(url) as response:
-                response.raise_for_status()
-                data = await response.json()
+            data = await self._read_shared(config_name)
+            if data is None:
+                url = urljoin(self.base_url, f"config/{config_name}")
+                async with self.session.get(url) as response:
+                    response.raise_for_status()
+                    data = await response.json()
 
-                if validate_data and config_name in self.schemas:
-                    valid, errors = self.validate(data, config_name)
-                    if not valid:
-                        raise ValidationError(f"Validation failed: {', '.join(errors)}")
+            if validate_data and config_name in self.schemas:
+                valid, errors = self.validate(data, config_name)
+                if not valid:
+                    raise ValidationError(f"Validation failed: {', '.join(errors)}")
 
-                if cache:
-                    self.cache[config_name] = data
+            if cache:
+                self.cache[config_name] = data
 
-                return data
+            self._publish(config_name, data)
+            return data
         except Exception as e:
             raise Exception(f"Get config failed: {str(e)}")
 
@@ -285,6 +741,12 @@ class AsyncConfigSDK:
             if not valid:
                 raise ValidationError(f"Validation failed: {', '.join(errors)}")
 
+        if validate_data and config_name in self.crud_rules:
+            current = await self.get(config_name, cache=False, validate_data=False)
+            valid, errors = self.check_crud(data, config_name, current)
+            if not valid:
+                raise ValidationError(f"CRUD check failed: {', '.join(errors)}")
+
         try:
             url = urljoin(self.base_url, f"config/{config_name}")
             async with self.session.put(url, json=data) as response:
@@ -294,6 +756,7 @@ class AsyncConfigSDK:
                 if config_name in self.cache:
                     self.cache[config_name] = updated
 
+                self._record_write(config_name, updated)
                 return updated
         except Exception as e:
             raise Exception(f"Update config failed: {str(e)}")
@@ -309,6 +772,11 @@ class AsyncConfigSDK:
                 if not valid:
                     raise ValidationError(f"Validation failed: {', '.join(errors)}")
 
+            if config_name in self.crud_rules:
+                valid, errors = self.check_crud(_deep_merge(current, updates), config_name, current)
+                if not valid:
+                    raise ValidationError(f"CRUD check failed: {', '.join(errors)}")
+
         try:
             url = urljoin(self.base_url, f"config/{config_name}")
             async with self.session.patch(url, json=updates) as response:
@@ -318,6 +786,7 @@ class AsyncConfigSDK:
                 if config_name in self.cache:
                     self.cache[config_name] = updated
 
+                self._record_write(config_name, updated)
                 return updated
         except Exception as e:
             raise Exception(f"Patch config failed: {str(e)}")
@@ -335,6 +804,12 @@ class AsyncConfigSDK:
         except Exception as e:
             raise Exception(f"Get CRUD failed: {str(e)}")
 
+    async def load_crud(self, config_name: str) -> CrudRules:
+        """Load and compile CRUD rules for local write checks"""
+        rules = CrudRules(await self.get_crud(config_name))
+        self.crud_rules[config_name] = rules
+        return rules
+
     async def watch(self, config_name: str, callback: Callable, interval: float = 5.0) -> Callable:
         """Watch configuration for changes"""
         if config_name in self.watchers:
@@ -379,6 +854,39 @@ class AsyncConfigSDK:
 
         return stop
 
+    async def _read_shared(self, config_name: str) -> Optional[dict]:
+        """Read from the shared cache; None falls back to HTTP"""
+        if not self.shared_cache or self.shared_cache.owner:
+            return None
+        try:
+            data = await self.shared_cache.read_async(
+                config_name, newer_than=self._shared_writes.get(config_name, 0)
+            )
+        except (RuntimeError, ValueError) as e:
+            logger.warning(f"Shared cache read failed for {config_name}: {str(e)}")
+            return None
+        if data is not None:
+            self._shared_writes.pop(config_name, None)
+        return data
+
+    def _publish(self, config_name: str, data: dict):
+        """Publish to the shared cache; failures never fail the request"""
+        if not self.shared_cache or not self.shared_cache.owner:
+            return
+        try:
+            self.shared_cache.publish(config_name, data)
+        except Exception as e:
+            logger.warning(f"Shared cache publish failed for {config_name}: {str(e)}")
+
+    def _record_write(self, config_name: str, data: dict):
+        """Owners publish the write; workers read it over HTTP until the owner republishes"""
+        if not self.shared_cache:
+            return
+        if self.shared_cache.owner:
+            self._publish(config_name, data)
+        else:
+            self._shared_writes[config_name] = self.shared_cache.version
+
     def clear_cache(self, config_name: Optional[str] = None):
         """Clear cache"""
         if config_name:
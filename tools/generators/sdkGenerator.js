@@ -939,9 +939,9 @@ ${new Date().toISOString()}
 Auto-generated on ${new Date().toISOString()}
 """
 
-from .config_sdk import ConfigSDK, AsyncConfigSDK
+from .config_sdk import ConfigSDK, AsyncConfigSDK, CrudRules, SharedConfigCache
 
-__all__ = ['ConfigSDK', 'AsyncConfigSDK']
+__all__ = ['ConfigSDK', 'AsyncConfigSDK', 'CrudRules', 'SharedConfigCache']
 __version__ = '1.0.0'
 `;
   }
@@ -1092,8 +1092,10 @@ pip install ./sdk/python
 
 - **Synchronous & Asynchronous APIs**
 - **Schema Validation** with jsonschema
+- **Local CRUD Checks** with compiled rules from \`get_crud\`
 - **Configuration Watching** with real-time updates
 - **Caching Support** for better performance
+- **Shared Cache** across worker processes on one host
 - **Type Safety** with Python type hints
 - **Context Manager Support** for proper resource cleanup
 
@@ -1156,6 +1158,24 @@ stop_watching = sdk.watch("appFooter_ui", on_change, interval=5.0)
 stop_watching()
 \`\`\`
 
+### Sharing Configs Between Processes
+
+\`\`\`python
+from maskservice_config_sdk import ConfigSDK, SharedConfigCache
+
+# Owner process (or sidecar): fetches, refreshes and publishes
+owner_cache = SharedConfigCache("maskservice_config", create=True)
+owner = ConfigSDK("http://localhost:3000/api", shared_cache=owner_cache)
+owner.watch("appFooter_ui", lambda error, data: None, interval=5.0)
+
+# Worker processes: read from shared memory, no HTTP requests
+worker = ConfigSDK("http://localhost:3000/api", shared_cache=SharedConfigCache("maskservice_config"))
+config = worker.get("appFooter_ui")
+stop_watching = worker.watch("appFooter_ui", on_change, interval=1.0)
+\`\`\`
+
+Only configs the owner keeps refreshing (e.g. with \`watch()\`) stay fresh in the shared cache. A worker reads its own writes over HTTP until the owner republishes that config.
+
 ## API Reference
 
 ### ConfigSDK (Synchronous)
@@ -1165,6 +1185,8 @@ stop_watching()
 - \`update(config_name: str, data: dict, validate_data: bool = True) -> dict\`
 - \`patch(config_name: str, updates: dict, validate_data: bool = True) -> dict\`
 - \`get_crud(config_name: str) -> dict\`
+- \`load_crud(config_name: str) -> CrudRules\`
+- \`check_crud(data: dict, config_name: str, current: dict) -> tuple[bool, list]\`
 - \`watch(config_name: str, callback: Callable, interval: float = 5.0) -> Callable\`
 - \`validate(data: dict, schema_name: str) -> tuple[bool, list]\`
 - \`clear_cache(config_name: Optional[str] = None)\`
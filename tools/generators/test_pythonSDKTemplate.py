@@ -0,0 +1,327 @@
+"""Tests for the Python configuration SDK template"""
+
+import asyncio
+import copy
+import json
+import subprocess
+import sys
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from pythonSDKTemplate import AsyncConfigSDK, ConfigSDK, CrudRules, SharedConfigCache
+
+CONFIG_DIR = Path(__file__).resolve().parents[2] / "config"
+
+
+def load_config(name: str) -> tuple:
+    crud = json.loads((CONFIG_DIR / name / "crud.json").read_text(encoding="utf-8"))
+    data = json.loads((CONFIG_DIR / name / "data.json").read_text(encoding="utf-8"))
+    return CrudRules(crud), data
+
+
+class ConfigServer(ThreadingHTTPServer):
+    """In-memory config API serving config/<name> and crud/<name>"""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ConfigHandler)
+        self.configs = {}
+        self.cruds = {}
+        self.schemas = {}
+        self.requests = []
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/api/"
+
+
+class ConfigHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def _route(self) -> tuple:
+        _, _, kind, name = self.path.split("/", 3)
+        return kind, name
+
+    def _reply(self, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200 if body is not None else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _body(self) -> dict:
+        return json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+    def do_GET(self):
+        kind, name = self._route()
+        self.server.requests.append(("GET", kind, name))
+        store = {"crud": self.server.cruds, "schemas": self.server.schemas}.get(kind, self.server.configs)
+        self._reply(store.get(name))
+
+    def do_PUT(self):
+        _, name = self._route()
+        self.server.requests.append(("PUT", "config", name))
+        self.server.configs[name] = self._body()
+        self._reply(self.server.configs[name])
+
+    def do_PATCH(self):
+        _, name = self._route()
+        self.server.requests.append(("PATCH", "config", name))
+        self.server.configs[name] = {**self.server.configs[name], **self._body()}
+        self._reply(self.server.configs[name])
+
+
+@pytest.fixture
+def server():
+    srv = ConfigServer()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def owner_cache():
+    cache = SharedConfigCache(f"test_{uuid.uuid4().hex[:12]}", size=4096, create=True)
+    yield cache
+    cache.close()
+
+
+def http_gets(server, name: str) -> int:
+    return server.requests.count(("GET", "config", name))
+
+
+@pytest.mark.parametrize("name", ["app", "menu", "router", "system", "test-scenarios", "workshop"])
+def test_crud_accepts_unchanged_shipped_data(name):
+    rules, data = load_config(name)
+    assert rules.check(copy.deepcopy(data), data) == (True, [])
+
+
+def test_crud_edit():
+    rules, data = load_config("router")
+    edited = copy.deepcopy(data)
+    edited["default"]["port"] = "8082"
+    assert rules.check(edited, data) == (True, [])
+
+    edited["default"]["port"] = "99999"
+    assert rules.check(edited, data) == (False, ["default/port: must be <= 65535"])
+
+    edited = copy.deepcopy(data)
+    edited["navigation"]["hashPrefix"] = "#!"
+    assert rules.check(edited, data) == (False, ["navigation/hashPrefix: field is not editable"])
+
+
+def test_crud_add_validates_every_leaf():
+    rules, data = load_config("workshop")
+    added = copy.deepcopy(data)
+    part = dict(added["spare_parts"]["default_parts"][0], id="F999", name="Filtr zapasowy")
+    added["spare_parts"]["default_parts"].append(part)
+    assert rules.check(added, data) == (True, [])
+
+    part.update(id="bogus", category="NOPE")
+    valid, errors = rules.check(added, data)
+    assert not valid
+    assert any(error.endswith("/id: does not match ^[A-Z]\\d{3}$|^CAL\\d{3}$|^SUP\\d{3}$|^MAINT\\d{3}$")
+               for error in errors)
+    assert any("/category: must be one of" in error for error in errors)
+
+    rules, data = load_config("router")
+    added = copy.deepcopy(data)
+    added["languages"].append(dict(added["languages"][0], code="DEU"))
+    valid, errors = rules.check(added, data)
+    assert not valid
+    assert any("/code: does not match ^[a-z]{2}$" in error for error in errors)
+
+
+def test_crud_add_rejected_where_not_addable():
+    rules, data = load_config("app")
+    assert rules.check({**data, "NEW": 1}, data) == (False, ["NEW: adding is not allowed"])
+
+
+def test_crud_delete_middle_list_item():
+    rules, data = load_config("router")
+    deleted = copy.deepcopy(data)
+    del deleted["languages"][0]
+    assert rules.check(deleted, data) == (True, [])
+
+    rules, data = load_config("workshop")
+    deleted = copy.deepcopy(data)
+    del deleted["spare_parts"]["default_parts"][0]
+    assert rules.check(deleted, data) == (True, [])
+
+
+def test_crud_delete_list_item_without_identity():
+    rules = CrudRules({"rules": {"deletable": ["steps/*"]}})
+    assert rules.check({"steps": ["a", "c"]}, {"steps": ["a", "b", "c"]}) == (True, [])
+
+    rules = CrudRules({"rules": {"deletable": []}})
+    assert rules.check({"steps": ["a", "c"]}, {"steps": ["a", "b", "c"]}) == (
+        False, ["steps/1: deleting is not allowed"])
+
+
+def test_crud_delete_protected():
+    rules, data = load_config("app")
+    deleted = dict(data)
+    del deleted["API_URL"]
+    assert rules.check(deleted, data) == (False, ["API_URL: deleting is not allowed"])
+
+
+def test_sdk_writes_check_crud_rules(server):
+    _, data = load_config("router")
+    server.configs["router"] = data
+    server.cruds["router"] = json.loads((CONFIG_DIR / "router" / "crud.json").read_text(encoding="utf-8"))
+
+    with ConfigSDK(server.base_url) as sdk:
+        sdk.load_crud("router")
+        with pytest.raises(Exception, match="navigation/hashPrefix: field is not editable"):
+            sdk.update("router", {**data, "navigation": {**data["navigation"], "hashPrefix": "#!"}})
+        sdk.patch("router", {"default": {"port": "9090"}})
+        with pytest.raises(Exception, match="default/port: must be <= 65535"):
+            sdk.patch("router", {"default": {"port": "99999"}})
+
+    assert server.requests.count(("PATCH", "config", "router")) == 1
+    assert server.requests.count(("PUT", "config", "router")) == 0
+
+
+def test_shared_cache_publish_read(owner_cache):
+    reader = SharedConfigCache(owner_cache.name)
+    try:
+        assert reader.read("app") is None
+
+        owner_cache.publish("app", {"A": 1})
+        version = owner_cache.version
+        owner_cache.publish("app", {"A": 1})
+        assert owner_cache.version == version
+
+        data = reader.read("app")
+        assert data == {"A": 1}
+        data["A"] = 99
+        assert reader.read("app") == {"A": 1}
+
+        assert reader.read("app", newer_than=version) is None
+        owner_cache.publish("app", {"A": 2})
+        assert reader.read("app", newer_than=version) == {"A": 2}
+
+        with pytest.raises(ValueError, match="too small"):
+            owner_cache.publish("big", {"x": "y" * 5000})
+        with pytest.raises(RuntimeError, match="owner"):
+            reader.publish("app", {"A": 3})
+    finally:
+        reader.close()
+
+
+def test_shared_cache_read_from_other_process(owner_cache):
+    owner_cache.publish("app", {"A": 1})
+    script = (
+        "import json, sys; from pythonSDKTemplate import SharedConfigCache; "
+        f"cache = SharedConfigCache({owner_cache.name!r}); print(json.dumps(cache.read('app'))); cache.close()"
+    )
+    for _ in range(2):
+        result = subprocess.run([sys.executable, "-c", script], cwd=Path(__file__).parent,
+                                capture_output=True, text=True, check=True)
+        assert json.loads(result.stdout) == {"A": 1}
+
+
+def test_shared_cache_owner_worker_round_trip(server, owner_cache):
+    server.configs["app"] = {"A": 1}
+    worker_cache = SharedConfigCache(owner_cache.name)
+    owner = ConfigSDK(server.base_url, shared_cache=owner_cache)
+    worker = ConfigSDK(server.base_url, shared_cache=worker_cache)
+    try:
+        assert owner.get("app") == {"A": 1}
+        assert worker.get("app") == {"A": 1}
+        assert http_gets(server, "app") == 1
+
+        worker.update("app", {"A": 2})
+        assert worker.get("app") == {"A": 2}
+        assert worker.get("app") == {"A": 2}
+        assert http_gets(server, "app") == 3
+
+        assert owner.get("app") == {"A": 2}
+        assert worker.get("app") == {"A": 2}
+        assert http_gets(server, "app") == 4
+
+        owner.update("app", {"A": 3})
+        assert worker.get("app") == {"A": 3}
+        assert http_gets(server, "app") == 4
+
+        owner.update("app", {"A": "y" * 5000})
+        assert server.configs["app"] == {"A": "y" * 5000}
+    finally:
+        owner.destroy()
+        worker.destroy()
+        worker_cache.close()
+
+
+def test_shared_cache_data_is_schema_validated(server, owner_cache):
+    server.configs["app"] = {"A": "not a number"}
+    server.schemas["app"] = {"type": "object", "properties": {"A": {"type": "integer"}}}
+    worker_cache = SharedConfigCache(owner_cache.name)
+    owner = ConfigSDK(server.base_url, shared_cache=owner_cache)
+    worker = ConfigSDK(server.base_url, shared_cache=worker_cache)
+    try:
+        owner.get("app")
+        worker.load_schema("app")
+        with pytest.raises(Exception, match="Validation failed"):
+            worker.get("app")
+        assert worker.get("app", validate_data=False) == {"A": "not a number"}
+        assert http_gets(server, "app") == 1
+    finally:
+        owner.destroy()
+        worker.destroy()
+        worker_cache.close()
+
+
+def test_shared_cache_unreadable_falls_back_to_http(server, owner_cache):
+    server.configs["app"] = {"A": 1}
+    owner_cache.publish("app", {"A": 0})
+    worker_cache = SharedConfigCache(owner_cache.name)
+    worker = ConfigSDK(server.base_url, shared_cache=worker_cache)
+    try:
+        # Owner died mid-publish: counter left odd
+        owner_cache.SEQ.pack_into(owner_cache.shm.buf, 0, owner_cache.version + 1)
+        assert worker.get("app") == {"A": 1}
+
+        # Corrupt payload behind a stable even counter
+        owner_cache.shm.buf[owner_cache.HEADER_SIZE:owner_cache.HEADER_SIZE + 4] = b"@@@@"
+        owner_cache.SEQ.pack_into(owner_cache.shm.buf, 0, owner_cache.version + 1)
+        assert worker.get("app") == {"A": 1}
+        assert http_gets(server, "app") == 2
+    finally:
+        worker.destroy()
+        worker_cache.close()
+
+
+def test_async_shared_read_does_not_block_event_loop(server, owner_cache):
+    server.configs["app"] = {"A": 1}
+    owner_cache.publish("app", {"A": 0})
+    owner_cache.SEQ.pack_into(owner_cache.shm.buf, 0, owner_cache.version + 1)
+    worker_cache = SharedConfigCache(owner_cache.name)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        async with AsyncConfigSDK(server.base_url, shared_cache=worker_cache) as worker:
+            data = await worker.get("app")
+        task.cancel()
+        return data, ticks
+
+    try:
+        data, ticks = asyncio.run(main())
+        assert data == {"A": 1}
+        assert ticks >= SharedConfigCache.MAX_RETRIES
+    finally:
+        worker_cache.close()